@@ -1,7 +1,9 @@
 from .formatters import FloatFormatter, ExponentialFormatter, IntFormatter
 from .table import Table
 from .errors import FixError, RelativeError, AbsoluteError
-from .columns import SerialNumberColumn, TextColumn, DataColumn
+from .columns import SerialNumberColumn, TextColumn, CategoricalColumn, DataColumn
+from .parallel import ParallelRenderer
+from .plan import RenderPlan
 
 __all__ = ["Table",
            "FloatFormatter",
@@ -12,4 +14,7 @@ __all__ = ["Table",
            "RelativeError",
            "SerialNumberColumn",
            "TextColumn",
-           "DataColumn"]
+           "CategoricalColumn",
+           "DataColumn",
+           "ParallelRenderer",
+           "RenderPlan"]
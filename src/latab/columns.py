@@ -3,7 +3,7 @@ import numpy as np
 from numpy.typing import NDArray
 from .formatters import Formatter, FloatFormatter, ExponentialFormatter
 from .errors import Error
-from .converter import convertUnitToLateX
+from .converter import convertUnitToLateX, escapeLateX, escapeLateXAll
 from astropy.units import Quantity
 
 
@@ -19,44 +19,129 @@ class Column(ABC):
     def getCell(self, row: int):
         pass
 
+    def getCells(self):
+        return [self.getCell(i) for i in range(len(self))]
+
 
 class TextColumn(Column):
 
-    def __init__(self, header: str, texts: list):
-        super(TextColumn, self).__init__(header)
-        self.__texts = texts
+    def __init__(self, header: str, texts: list, escape: bool = False):
+        if escape:
+            super(TextColumn, self).__init__(escapeLateX(header))
+            self.__texts = escapeLateXAll(texts)
+        else:
+            super(TextColumn, self).__init__(header)
+            self.__texts = texts
 
     def getCell(self, row: int):
         return self.__texts[row]
 
+    def getCells(self):
+        return list(self.__texts)
+
     def __len__(self):
         return len(self.__texts)
 
 
 class SerialNumberColumn(TextColumn):
 
-    def __init__(self, header: str, rowCount: int):
+    def __init__(self, header: str, rowCount: int, escape: bool = False):
         texts = []
         for i in range(rowCount):
             texts.append("{}.".format(i + 1))
-        super(SerialNumberColumn, self).__init__(header, texts)
+        super(SerialNumberColumn, self).__init__(escapeLateX(header) if escape else header, texts)
+
+
+class CategoricalColumn(Column):
+
+    def __init__(self, header: str, codes: NDArray[np.int_], categories: list, escape: bool = False, placeholder: str = " "):
+        if not isinstance(codes, np.ndarray) or codes.dtype.kind not in "iu":
+            raise Exception("Codes must be of type numpy.ndarray with integer elements")
+        if len(codes) > 0 and (np.min(codes) < -1 or np.max(codes) >= len(categories)):
+            raise Exception("Codes must be valid indices of the categories or -1")
+        super(CategoricalColumn, self).__init__(escapeLateX(header) if escape else header)
+        categories = [str(category) for category in categories]
+        if escape:
+            categories = escapeLateXAll(categories)
+        # The code -1 marks a missing value and indexes the placeholder at the end of the vocabulary.
+        self.__categories = np.array(categories + [placeholder], dtype=object)
+        self.__codes = codes
+
+    @staticmethod
+    def fromTexts(header: str, texts: list, escape: bool = False):
+        categories, codes = np.unique(np.asarray(texts, dtype=str), return_inverse=True)
+        return CategoricalColumn(header, codes.reshape(-1), categories.tolist(), escape)
+
+    @staticmethod
+    def fromCategorical(header: str, categorical, escape: bool = False, placeholder: str = " "):
+        return CategoricalColumn(header, np.asarray(categorical.codes), list(categorical.categories), escape, placeholder)
+
+    def getCell(self, row: int):
+        return self.__categories[self.__codes[row]]
+
+    def getCells(self):
+        return self.__categories[self.__codes].tolist()
+
+    def __len__(self):
+        return len(self.__codes)
+
+
+class MultirowColumn(Column):
+
+    def __init__(self, column: Column, sizes: NDArray[np.int_]):
+        if len(column) != len(sizes):
+            raise Exception("Column must have one cell for every group")
+        super(MultirowColumn, self).__init__(column.getHeader())
+        self.__column = column
+        self.__sizes = np.asarray(sizes)
+        self.__starts = np.cumsum(self.__sizes) - self.__sizes
+
+    def getColumn(self):
+        return self.__column
+
+    def getMissingRows(self):
+        return self.__starts[self.__column.getMissingRows()]
+
+    def getCell(self, row: int):
+        if row < 0 or row >= len(self):
+            raise IndexError("Row index out of range")
+        group = np.searchsorted(self.__starts, row, side="right") - 1
+        if row != self.__starts[group]:
+            return ""
+        return "\\multirow{" + str(self.__sizes[group]) + "}{*}{" + self.__column.getCell(group) + "}"
+
+    def getCells(self):
+        cells = [""] * len(self)
+        for start, size, cell in zip(self.__starts.tolist(), self.__sizes.tolist(), self.__column.getCells()):
+            cells[start] = "\\multirow{" + str(size) + "}{*}{" + cell + "}"
+        return cells
+
+    def __len__(self):
+        return int(np.sum(self.__sizes))
 
 
 class DataColumn(Column):
 
-    def __init__(self, header: str, data: NDArray[np.float64] | Quantity, error: Error = None, formatter: Formatter = None):
+    def __init__(self, header: str, data: NDArray[np.float64] | Quantity, error: Error = None, formatter: Formatter = None,
+                 placeholder: str = " "):
         super(DataColumn, self).__init__(header)
 
         if isinstance(data, Quantity):
-            self.__data = data.value
             self._header = self._header + " [" + convertUnitToLateX(data.unit) + "]"
+            mask = getattr(data, "mask", None)
+            self.__data = np.asarray(getattr(data, "unmasked", data).value)
         elif isinstance(data, np.ndarray):
-            self.__data = data
+            mask = np.ma.getmaskarray(data) if isinstance(data, np.ma.MaskedArray) else None
+            self.__data = np.ma.getdata(data)
         else:
             raise Exception("Data must be of type numpy.ndarray or astropy.units.Quantity")
 
+        self.__placeholder = placeholder
+        self.__mask = self.__missingMask(self.__data, mask)
+
         if formatter is None:
-            if np.ceil(np.abs(np.log10(np.max(self.__data)))) > 4:
+            valid = self.__data[~self.__mask]
+            if len(valid) > 0 and np.ceil(np.abs(np.log10(np.max(valid)))) > 4:
                 self.__formatter = ExponentialFormatter()
             else:
                 self.__formatter = FloatFormatter()
@@ -67,18 +152,43 @@ class DataColumn(Column):
 
         if error is not None:
             if isinstance(error, Error):
-                self.__errors = error.getErrors(self.__data)
+                errors = error.getErrors(self.__data)
+                # Errors can be numpy masked arrays or astropy Masked arrays, unwrapped like the data.
+                errorMask = getattr(errors, "mask", None)
+                self.__errors = np.asarray(getattr(errors, "unmasked", np.ma.getdata(errors)))
+                self.__mask |= self.__missingMask(self.__errors, errorMask)
             else:
                 raise Exception("Error must be of type latab.Error")
 
+    @staticmethod
+    def __missingMask(data: NDArray, mask: NDArray[np.bool_] | None):
+        missing = ~np.isfinite(data) if np.issubdtype(data.dtype, np.inexact) else np.zeros(data.shape, dtype=bool)
+        if mask is not None and mask is not np.ma.nomask:
+            missing |= np.asarray(mask, dtype=bool)
+        return missing
+
     def getHeader(self):
         return self._header
 
     def getCell(self, row: int):
+        if self.__mask[row]:
+            return self.__placeholder
         if hasattr(self, "_DataColumn__errors"):
             return self.__formatter.format(self.__data[row], self.__errors[row])
         else:
             return self.__formatter.format(self.__data[row])
 
+    def getCells(self):
+        valid = ~self.__mask
+        cells = np.full(len(self.__data), self.__placeholder, dtype=object)
+        if hasattr(self, "_DataColumn__errors"):
+            cells[valid] = self.__formatter.formatArray(self.__data[valid], self.__errors[valid])
+        else:
+            cells[valid] = self.__formatter.formatArray(self.__data[valid])
+        return cells.tolist()
+
+    def getMissingRows(self):
+        return np.flatnonzero(self.__mask)
+
     def __len__(self):
         return len(self.__data)
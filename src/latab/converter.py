@@ -1,6 +1,29 @@
 from astropy.units import UnitBase
 import numpy as np
 
+_LATEX_SPECIAL_CHARACTERS = str.maketrans({
+    "\\": "\\textbackslash{}",
+    "&": "\\&",
+    "%": "\\%",
+    "$": "\\$",
+    "#": "\\#",
+    "_": "\\_",
+    "{": "\\{",
+    "}": "\\}",
+    "~": "\\textasciitilde{}",
+    "^": "\\textasciicircum{}"
+})
+
+
+def escapeLateX(text: str):
+    return text.translate(_LATEX_SPECIAL_CHARACTERS)
+
+
+def escapeLateXAll(texts: list):
+    # Repeated values (e.g. category labels) are escaped only once.
+    escaped = {text: text.translate(_LATEX_SPECIAL_CHARACTERS) for text in set(texts)}
+    return list(map(escaped.__getitem__, texts))
+
 
 def convertUnitToLateX(unit: UnitBase):
     s = "$\mathrm{"
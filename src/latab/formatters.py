@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 import numpy as np
+from numpy.typing import NDArray
 import sys
 
 
@@ -13,6 +14,19 @@ class Formatter(ABC):
     def format(self, value: float, error: float | None = None):
         pass
 
+    def formatArray(self, values: NDArray[np.float64], errors: NDArray[np.float64] | None = None):
+        if errors is None:
+            return [self.format(value) for value in values]
+        else:
+            return [self.format(value, error) for value, error in zip(values, errors)]
+
+    @staticmethod
+    def _isNumeric(values: NDArray, errors: NDArray | None):
+        for array in (values, errors):
+            if array is not None and not (isinstance(array, np.ndarray) and array.dtype.kind in "biuf"):
+                return False
+        return True
+
 
 class FloatFormatter(Formatter):
 
@@ -20,7 +34,7 @@ class FloatFormatter(Formatter):
         super(FloatFormatter, self).__init__(precision, errorPrecision)
 
     def format(self, value: float | None, error: float | None = None):
-        if value is None:
+        if value is None or not np.isfinite(value):
             return " "
         if error is None:
             return ("{:." + str(self._precision) + "f} ").format(value)
@@ -28,6 +42,20 @@ class FloatFormatter(Formatter):
             template = ("${:." + str(self._precision) + "f} \\pm " + "{:." + str(self._errorPrecision) + "f}" + "$ ")
             return template.format(value, error)
 
+    def formatArray(self, values: NDArray[np.float64], errors: NDArray[np.float64] | None = None):
+        # Subclasses overriding format() must be formatted by their own implementation.
+        if type(self).format is not FloatFormatter.format or not self._isNumeric(values, errors):
+            return Formatter.formatArray(self, values, errors)
+        values = values.astype(np.float64)
+        if errors is None:
+            template = "{:." + str(self._precision) + "f} "
+            cells = np.array(list(map(template.format, values.tolist())), dtype=object)
+        else:
+            template = "${:." + str(self._precision) + "f} \\pm " + "{:." + str(self._errorPrecision) + "f}" + "$ "
+            cells = np.array(list(map(template.format, values.tolist(), errors.astype(np.float64).tolist())), dtype=object)
+        cells[~np.isfinite(values)] = " "
+        return cells.tolist()
+
 
 class IntFormatter(FloatFormatter):
 
@@ -40,8 +68,10 @@ class ExponentialFormatter(Formatter):
     def __init__(self, precision: int = 3, errorPrecision: int = 4):
         super(ExponentialFormatter, self).__init__(precision, errorPrecision)
 
-    def format(self, value: float, error: float | None = None):
-        if np.abs(value) < sys.float_info.min:
+    def format(self, value: float | None, error: float | None = None):
+        if value is None or not np.isfinite(value):
+            return " "
+        elif np.abs(value) < sys.float_info.min:
             return "0"
         elif error is None:
             a = int(np.floor(np.log10(np.abs(value))))
@@ -57,3 +87,29 @@ class ExponentialFormatter(Formatter):
             s = s.format(b, c)
             s += "{" + str(a) + "}$ "
         return s
+
+    def formatArray(self, values: NDArray[np.float64], errors: NDArray[np.float64] | None = None):
+        # Subclasses overriding format() must be formatted by their own implementation.
+        if type(self).format is not ExponentialFormatter.format or not self._isNumeric(values, errors):
+            return Formatter.formatArray(self, values, errors)
+        values = values.astype(np.float64)
+        missing = ~np.isfinite(values)
+        zero = np.abs(values) < sys.float_info.min
+        regular = ~(missing | zero)
+        exponents = np.zeros(values.shape, dtype=np.int64)
+        exponents[regular] = np.floor(np.log10(np.abs(values[regular])))
+        # Only a few distinct exponents occur, the divisors are computed as in format() to keep the output identical.
+        unique, inverse = np.unique(exponents, return_inverse=True)
+        divisors = np.array([float(10**int(a)) for a in unique])[inverse.reshape(-1)]
+        mantissas = (values / divisors).tolist()
+        if errors is None:
+            template = "${:." + str(self._precision) + "f} \\cdot 10^{{{}}}$ "
+            cells = list(map(template.format, mantissas, exponents.tolist()))
+        else:
+            template = "$({:." + str(self._precision) + "f} \\pm {:." + str(self._errorPrecision) + "f})\\cdot 10^{{{}}}$ "
+            errorMantissas = (errors.astype(np.float64) / divisors).tolist()
+            cells = list(map(template.format, mantissas, errorMantissas, exponents.tolist()))
+        cells = np.array(cells, dtype=object)
+        cells[zero] = "0"
+        cells[missing] = " "
+        return cells.tolist()
@@ -0,0 +1,89 @@
+import numpy as np
+from numpy.typing import NDArray
+from astropy.units import Quantity
+
+
+class Groups():
+
+    def __init__(self, keys, contiguous: bool = False, placeholder: str = " "):
+        if hasattr(keys, "codes") and hasattr(keys, "categories"):
+            codes = np.asarray(keys.codes)
+            categories = np.array([str(category) for category in keys.categories] + [placeholder], dtype=object)
+            # The code -1 marks a missing key, these rows form a group labelled with the placeholder.
+            codes = np.where(codes < 0, len(categories) - 1, codes)
+        else:
+            # The keys are sorted by their own type (numbers numerically), only the labels are converted to text.
+            categories, codes = np.unique(np.asarray(keys), return_inverse=True)
+            codes = codes.reshape(-1)
+            categories = np.array([str(category) for category in categories.tolist()], dtype=object)
+
+        if contiguous:
+            self.__order = np.arange(len(codes))
+        else:
+            self.__order = np.argsort(codes, kind="stable")
+        sortedCodes = codes[self.__order]
+        if len(codes) == 0:
+            self.__starts = np.zeros(0, dtype=np.int64)
+        else:
+            self.__starts = np.flatnonzero(np.concatenate(([True], sortedCodes[1:] != sortedCodes[:-1])))
+        if contiguous and len(self.__starts) != len(np.unique(codes)):
+            raise Exception("Rows must be ordered by the group keys")
+        self.__sizes = np.diff(np.append(self.__starts, len(codes)))
+        self.__labels = categories[sortedCodes[self.__starts]].tolist()
+
+    def getLabels(self):
+        return self.__labels
+
+    def getSizes(self):
+        return self.__sizes
+
+    def __len__(self):
+        return len(self.__starts)
+
+    def mean(self, data: NDArray[np.float64] | Quantity):
+        values, counts = self.__values(data)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = self.__sum(values, counts) / counts
+        return self.__withUnit(means, data)
+
+    def std(self, data: NDArray[np.float64] | Quantity, ddof: int = 0):
+        values, counts = self.__values(data)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = self.__sum(values, counts) / counts
+            deviations = values - np.repeat(means, counts)
+            stds = np.sqrt(self.__sum(deviations * deviations, counts) / (counts - ddof))
+        return self.__withUnit(stds, data)
+
+    def __sum(self, values: NDArray[np.float64], counts: NDArray[np.int_]):
+        # The valid values are contiguous per group, empty groups are left at zero.
+        sums = np.zeros(len(self))
+        nonEmpty = counts > 0
+        if np.any(nonEmpty):
+            sums[nonEmpty] = np.add.reduceat(values, (np.cumsum(counts) - counts)[nonEmpty])
+        return sums
+
+    def __values(self, data: NDArray[np.float64] | Quantity):
+        # Masked and non-finite values are left out, the valid values remain ordered by group.
+        if isinstance(data, Quantity):
+            mask = getattr(data, "mask", None)
+            values = getattr(data, "unmasked", data).value
+        elif isinstance(data, np.ndarray):
+            mask = np.ma.getmask(data)
+            values = np.ma.getdata(data)
+        else:
+            raise Exception("Data must be of type numpy.ndarray or astropy.units.Quantity")
+        if len(values) != len(self.__order):
+            raise Exception("Data and group keys have different lengths")
+        values = values.astype(np.float64)
+        valid = np.isfinite(values)
+        if mask is not None and mask is not np.ma.nomask:
+            valid &= ~np.asarray(mask, dtype=bool)
+        values = values[self.__order]
+        valid = valid[self.__order]
+        counts = np.add.reduceat(valid.astype(np.int64), self.__starts) if len(self) > 0 else np.zeros(0, dtype=np.int64)
+        return values[valid], counts
+
+    def __withUnit(self, values: NDArray[np.float64], data: NDArray[np.float64] | Quantity):
+        if isinstance(data, Quantity):
+            return Quantity(values, data.unit)
+        return values
@@ -0,0 +1,124 @@
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+import numpy as np
+from numpy.typing import NDArray
+from astropy.units import Quantity
+from astropy.utils.masked import Masked
+
+# Arrays attached by the worker processes, keyed by the name given by the user.
+_workerArrays = {}
+# Keeps the worker's shared memory handles alive while the arrays are in use.
+_workerBlocks = []
+
+
+def _share(array: NDArray):
+    block = SharedMemory(create=True, size=max(array.nbytes, 1))
+    view = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)
+    view[...] = array
+    return block, (block.name, array.shape, array.dtype.str)
+
+
+def _attach(spec: tuple):
+    name, shape, dtype = spec
+    block = SharedMemory(name=name)
+    _workerBlocks.append(block)
+    view = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+    view.flags.writeable = False
+    return view
+
+
+def _initializeWorker(specs: dict):
+    for key, (dataSpec, maskSpec, unit) in specs.items():
+        array = _attach(dataSpec)
+        if unit is not None:
+            array = Quantity(array, unit, copy=False)
+            if maskSpec is not None:
+                array = Masked(array, mask=_attach(maskSpec))
+        elif maskSpec is not None:
+            array = np.ma.MaskedArray(array, mask=_attach(maskSpec), copy=False)
+        _workerArrays[key] = array
+
+
+def _renderWorker(builder, rows: slice | None, tabLength: int, separator: chr):
+    if rows is None:
+        arrays = _workerArrays
+    else:
+        arrays = {key: array[rows] for key, array in _workerArrays.items()}
+    return builder(arrays).lines(tabLength, separator)
+
+
+class ParallelRenderer():
+
+    """
+    Renders tables built from the same arrays in a pool of worker processes.
+
+    The arrays are copied into shared memory once, when the renderer is created, and the workers
+    access them by reference. A table is described by a builder: a picklable (module level) function
+    which receives a dictionary of the shared arrays (sliced to the requested rows) and returns a
+    latab.Table. Only the builder and the rendered lines are sent between the processes.
+    """
+
+    def __init__(self, arrays: dict, processes: int = None):
+        self.__blocks = []
+        specs = {}
+        try:
+            for key, array in arrays.items():
+                unit = None
+                mask = None
+                if isinstance(array, Quantity):
+                    unit = array.unit
+                    mask = getattr(array, "mask", None)
+                    array = getattr(array, "unmasked", array).value
+                elif isinstance(array, np.ma.MaskedArray):
+                    mask = np.ma.getmaskarray(array)
+                    array = np.ma.getdata(array)
+                elif not isinstance(array, np.ndarray):
+                    raise Exception("Shared arrays must be of type numpy.ndarray or astropy.units.Quantity")
+                if np.asarray(array).dtype.hasobject:
+                    raise Exception("Shared arrays must be of type numpy.ndarray or astropy.units.Quantity "
+                                    "without Python objects")
+                maskSpec = None
+                if mask is not None:
+                    block, maskSpec = _share(np.asarray(mask, dtype=bool))
+                    self.__blocks.append(block)
+                block, dataSpec = _share(np.asarray(array))
+                self.__blocks.append(block)
+                specs[key] = (dataSpec, maskSpec, unit)
+            self.__pool = Pool(processes, initializer=_initializeWorker, initargs=(specs,))
+        except BaseException:
+            self.__release()
+            raise
+
+    def lines(self, builder, rows: slice = None, tabLength: int = 4, separator: chr = '.'):
+        return self.__pool.apply(_renderWorker, (builder, rows, tabLength, separator))
+
+    def render(self, tasks: list, tabLength: int = 4, separator: chr = '.'):
+        """
+        Renders many tables in parallel. Every task is either a builder or a (builder, rows) tuple,
+        where rows is a slice selecting the rows of the shared arrays passed to the builder.
+        Returns the lines of the tables in the order of the tasks.
+        """
+        arguments = []
+        for task in tasks:
+            builder, rows = task if isinstance(task, tuple) else (task, None)
+            arguments.append((builder, rows, tabLength, separator))
+        return self.__pool.starmap(_renderWorker, arguments)
+
+    def close(self):
+        if hasattr(self, "_ParallelRenderer__pool"):
+            self.__pool.close()
+            self.__pool.join()
+            del self.__pool
+        self.__release()
+
+    def __release(self):
+        for block in self.__blocks:
+            block.close()
+            block.unlink()
+        self.__blocks = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -0,0 +1,46 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class RenderPlan():
+
+    """
+    Immutable, fully resolved form of a table, created by Table.compile(). Every cell is formatted
+    when the plan is compiled, so rendering only joins strings and the same plan can be rendered
+    from several threads at the same time.
+    """
+
+    headers: tuple
+    columns: tuple
+    decimalColumns: tuple
+    placeholderRows: tuple
+    rowEnds: tuple
+    caption: str | None
+
+    def lines(self, tabLength: int = 4, separator: chr = '.'):
+        indent = "\t\t".expandtabs(tabLength)
+        lines = []
+        lines.append("\\begin{table}")
+        lines.append("\t\\centering".expandtabs(tabLength))
+        lines.append(("\t\\begin{tabular}{|" + "c|" * len(self.headers) + "} \\hline").expandtabs(tabLength))
+        lines.append(indent + " & ".join(self.headers) + " \\\\ \\hline")
+        columns = self.columns
+        if separator != '.':
+            # Replaced lazily, so no copy of the cells is kept while the rows are built. Placeholders are the
+            # user's literal text and are left unchanged.
+            columns = [self.__localize(cells, placeholders, separator) if decimal else cells
+                       for cells, decimal, placeholders in zip(self.columns, self.decimalColumns, self.placeholderRows)]
+        rows = map(" & ".join, zip(*columns))
+        for row, rowEnd in zip(rows, self.rowEnds):
+            lines.append(indent + row + rowEnd)
+        lines.append("\t\\end{tabular}".expandtabs(tabLength))
+        if self.caption is not None:
+            lines.append(("\t\\caption{" + self.caption + "}").expandtabs(tabLength))
+        lines.append("\\end{table}")
+        return lines
+
+    @staticmethod
+    def __localize(cells: tuple, placeholders: frozenset, separator: chr):
+        if len(placeholders) == 0:
+            return (cell.replace(".", separator) for cell in cells)
+        return (cell if row in placeholders else cell.replace(".", separator) for row, cell in enumerate(cells))
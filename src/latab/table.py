@@ -1,16 +1,24 @@
+import numpy as np
 from numpy import float64
-from .columns import DataColumn, SerialNumberColumn, TextColumn
+from .columns import DataColumn, SerialNumberColumn, TextColumn, CategoricalColumn, MultirowColumn
 from astropy.units import Quantity
 from numpy.typing import NDArray
 from .formatters import Formatter
-from .errors import Error
+from .errors import Error, AbsoluteError
+from .converter import escapeLateX
+from .grouping import Groups
+from .plan import RenderPlan
 
 
 class Table():
 
-    def __init__(self, caption: str = None):
+    def __init__(self, caption: str = None, escape: bool = False):
         self.__columns = []
-        self.__caption = caption
+        self.__escape = escape
+        if escape and caption is not None:
+            self.__caption = escapeLateX(caption)
+        else:
+            self.__caption = caption
 
     def __checkRowCount(self, rowCount: int):
         if not hasattr(self, "_Table__rowCount"):
@@ -18,50 +26,92 @@ class Table():
         elif rowCount != self.__rowCount:
             raise Exception("Columns have different lengths")
 
-    def serialColumn(self, header: str, rowCount: int):
+    def serialColumn(self, header: str, rowCount: int, escape: bool = None):
         self.__checkRowCount(rowCount)
-        self.__columns.append(SerialNumberColumn(header, rowCount))
+        self.__columns.append(SerialNumberColumn(header, rowCount, self.__escape if escape is None else escape))
         return self
 
-    def textColumn(self, header: str, texts: list):
+    def textColumn(self, header: str, texts: list, escape: bool = None):
         self.__checkRowCount(len(texts))
-        self.__columns.append(TextColumn(header, texts))
+        self.__columns.append(TextColumn(header, texts, self.__escape if escape is None else escape))
         return self
 
-    def dataColumn(self, header: str, data: NDArray[float64] | Quantity, error: Error = None, formatter: Formatter = None):
+    def categoricalColumn(self, header: str, values, categories: list = None, escape: bool = None,
+                          placeholder: str = " "):
+        escape = self.__escape if escape is None else escape
+        if categories is not None:
+            column = CategoricalColumn(header, values, categories, escape, placeholder)
+        elif hasattr(values, "codes") and hasattr(values, "categories"):
+            column = CategoricalColumn.fromCategorical(header, values, escape, placeholder)
+        else:
+            column = CategoricalColumn.fromTexts(header, values, escape)
+        self.__checkRowCount(len(column))
+        self.__columns.append(column)
+        return self
+
+    def dataColumn(self, header: str, data: NDArray[float64] | Quantity, error: Error = None, formatter: Formatter = None,
+                   placeholder: str = " "):
         self.__checkRowCount(len(data))
-        self.__columns.append(DataColumn(header, data, error, formatter))
+        self.__columns.append(DataColumn(header, data, error, formatter, placeholder))
         return self
 
-    def lines(self, tabLength: int = 4, separator: chr = '.'):
-        lines = []
-        lines.append("\\begin{table}")
-        lines.append("\t\\centering".expandtabs(tabLength))
-        lines.append(("\t\\begin{tabular}{|" + "c|" * len(self.__columns) + "} \\hline").expandtabs(tabLength))
-        s = "\t\t".expandtabs(tabLength)
+    def groupBy(self, header: str, keys, aggregations: dict, formatter: Formatter = None, multirow: bool = False,
+                escape: bool = None, ddof: int = 0, placeholder: str = " "):
+        escape = self.__escape if escape is None else escape
+        groups = Groups(keys, multirow, placeholder)
+        keyColumn = TextColumn(header, groups.getLabels(), escape)
+        aggregateColumns = []
+        for aggregateHeader, data in aggregations.items():
+            error = AbsoluteError(groups.std(data, ddof))
+            aggregateColumns.append(DataColumn(aggregateHeader, groups.mean(data), error, formatter, placeholder))
+        if multirow:
+            sizes = groups.getSizes()
+            if hasattr(self, "_Table__groupSizes") and not np.array_equal(sizes, self.__groupSizes):
+                raise Exception("Tables can only be grouped by one key")
+            self.__checkRowCount(len(keys))
+            self.__groupSizes = sizes
+            self.__columns.append(MultirowColumn(keyColumn, sizes))
+            self.__columns.extend(MultirowColumn(column, sizes) for column in aggregateColumns)
+        else:
+            self.__checkRowCount(len(groups))
+            self.__columns.append(keyColumn)
+            self.__columns.extend(aggregateColumns)
+        return self
+
+    def __rowEnds(self):
+        if not hasattr(self, "_Table__groupSizes"):
+            return [" \\\\ \\hline"] * self.__rowCount
+        # Inside a group only the columns not spanning the group are separated by a line.
+        clines = ""
+        first = None
+        for i, column in enumerate(self.__columns + [None]):
+            if column is not None and not isinstance(column, MultirowColumn):
+                first = i if first is None else first
+            elif first is not None:
+                clines += "\\cline{" + str(first + 1) + "-" + str(i) + "}"
+                first = None
+        rowEnds = [(" \\\\ " + clines).rstrip()] * self.__rowCount
+        for end in np.cumsum(self.__groupSizes):
+            rowEnds[end - 1] = " \\\\ \\hline"
+        return rowEnds
+
+    def compile(self):
+        headers = []
+        columns = []
+        decimalColumns = []
+        placeholderRows = []
         for column in self.__columns:
-            s += column.getHeader()
-            s += " & "
-        s = s[0:-2]
-        s += "\\\\ \hline"
-        lines.append(s)
-        for i in range(self.__rowCount):
-            s = "\t\t".expandtabs(tabLength)
-            for column in self.__columns:
-                cell = column.getCell(i)
-                if isinstance(column, DataColumn) and separator != '.':
-                    s += cell.replace(".", separator)
-                else:
-                    s += cell
-                s += " & "
-            s = s[0:-2]
-            s += "\\\\ \hline"
-            lines.append(s)
-        lines.append("\t\\end{tabular}".expandtabs(tabLength))
-        if self.__caption is not None:
-            lines.append(("\t\caption{" + self.__caption + "}").expandtabs(tabLength))
-        lines.append("\\end{table}")
-        return lines
+            headers.append(column.getHeader())
+            columns.append(tuple(column.getCells()))
+            data = column.getColumn() if isinstance(column, MultirowColumn) else column
+            decimal = isinstance(data, DataColumn)
+            decimalColumns.append(decimal)
+            placeholderRows.append(frozenset(column.getMissingRows().tolist()) if decimal else frozenset())
+        return RenderPlan(tuple(headers), tuple(columns), tuple(decimalColumns), tuple(placeholderRows),
+                          tuple(self.__rowEnds()), self.__caption)
+
+    def lines(self, tabLength: int = 4, separator: chr = '.'):
+        return self.compile().lines(tabLength, separator)
 
     def print(self, tabLength: int = 4, separator: chr = '.'):
         for line in self.lines(tabLength, separator):
@@ -0,0 +1,267 @@
+from unittest import TestCase, main
+import os
+import sys
+import time
+import numpy as np
+from astropy import units
+from astropy.utils.masked import Masked
+from src.latab import (Table, FloatFormatter, ExponentialFormatter, IntFormatter, FixError, RelativeError, AbsoluteError,
+                       TextColumn, CategoricalColumn, DataColumn, ParallelRenderer)
+from src.latab.columns import MultirowColumn
+from src.latab.grouping import Groups
+from src.latab.converter import escapeLateX
+
+# The row count can be raised (e.g. to millions) for a thorough run, the throughputs are printed when requested.
+ROWS = int(os.environ.get("LATAB_PARITY_ROWS", 10000))
+REPORT = "LATAB_PARITY_REPORT" in os.environ
+SEED = 20241019
+UNITS = [None, units.kg, units.g / units.cm**3, units.m * units.s**-2]
+LABELS = ["star", "planet_b", "R&D", "50%", "#1", "moon"]
+
+
+def randomValues(rng: np.random.Generator, rows: int):
+    values = rng.uniform(1, 10, rows) * 10.0**rng.integers(-30, 30, rows)
+    values *= rng.choice([-1, 1], rows)
+    values[rng.random(rows) < 0.01] = 0.0
+    return values
+
+
+def randomData(rng: np.random.Generator, rows: int, missing: bool):
+    values = randomValues(rng, rows)
+    unit = UNITS[rng.integers(len(UNITS))]
+    if missing:
+        values[rng.random(rows) < 0.01] = rng.choice([np.nan, np.inf, -np.inf])
+        mask = rng.random(rows) < 0.01
+        # Multiplying a numpy masked array by a unit drops the mask, masked quantities need Masked.
+        return np.ma.array(values, mask=mask) if unit is None else Masked(values * unit, mask=mask)
+    return values if unit is None else values * unit
+
+
+def randomError(rng: np.random.Generator, data):
+    kind = rng.integers(4)
+    if kind == 0:
+        return None
+    elif kind == 1:
+        return FixError(float(rng.uniform(0, 1)))
+    elif kind == 2:
+        return RelativeError(float(rng.uniform(0, 0.2)))
+    values = np.ma.getdata(getattr(getattr(data, "unmasked", data), "value", data))
+    return AbsoluteError(np.abs(values) * rng.uniform(0, 0.2, len(data)))
+
+
+class BracketFormatter(ExponentialFormatter):
+
+    def format(self, value: float | None, error: float | None = None):
+        return "[" + super(BracketFormatter, self).format(value, error) + "]"
+
+
+def randomFormatter(rng: np.random.Generator):
+    return [None, FloatFormatter(), FloatFormatter(int(rng.integers(0, 6)), int(rng.integers(0, 6))), IntFormatter(),
+            ExponentialFormatter(), ExponentialFormatter(int(rng.integers(0, 6)), int(rng.integers(0, 6))),
+            BracketFormatter()][rng.integers(7)]
+
+
+def randomTable(rng: np.random.Generator, rows: int):
+    escape = bool(rng.integers(2))
+    table = Table("Random table #" + str(rng.integers(1000)), escape).serialColumn("No.", rows)
+    table.textColumn("Label_1", rng.choice(LABELS, rows).tolist())
+    table.categoricalColumn("Label_2", rng.choice(LABELS, rows).tolist())
+    for i in range(3):
+        data = randomData(rng, rows, bool(rng.integers(2)))
+        table.dataColumn("Data " + str(i), data, randomError(rng, data), randomFormatter(rng), "n.a.")
+    return table
+
+
+def referenceLines(table: Table, tabLength: int = 4, separator: chr = '.'):
+    # Scalar reference renderer: formats every cell with Column.getCell, as latab 1.0 did.
+    columns = table._Table__columns
+    caption = table._Table__caption
+    lines = []
+    lines.append("\\begin{table}")
+    lines.append("\t\\centering".expandtabs(tabLength))
+    lines.append(("\t\\begin{tabular}{|" + "c|" * len(columns) + "} \\hline").expandtabs(tabLength))
+    s = "\t\t".expandtabs(tabLength)
+    for column in columns:
+        s += column.getHeader()
+        s += " & "
+    s = s[0:-2]
+    s += "\\\\ \\hline"
+    lines.append(s)
+    for i in range(table._Table__rowCount):
+        s = "\t\t".expandtabs(tabLength)
+        for column in columns:
+            cell = column.getCell(i)
+            data = column.getColumn() if isinstance(column, MultirowColumn) else column
+            if isinstance(data, DataColumn) and separator != '.' and not isPlaceholder(data, cell):
+                s += cell.replace(".", separator)
+            else:
+                s += cell
+            s += " & "
+        s = s[0:-2]
+        s += referenceRowEnd(columns, i, table._Table__rowCount)
+        lines.append(s)
+    lines.append("\t\\end{tabular}".expandtabs(tabLength))
+    if caption is not None:
+        lines.append(("\t\\caption{" + caption + "}").expandtabs(tabLength))
+    lines.append("\\end{table}")
+    return lines
+
+
+def isPlaceholder(column: DataColumn, cell: str):
+    placeholder = column._DataColumn__placeholder
+    return cell == placeholder or (cell.startswith("\\multirow{") and cell.endswith("}{" + placeholder + "}"))
+
+
+def referenceRowEnd(columns: list, row: int, rowCount: int):
+    multirowColumns = [i for i, column in enumerate(columns) if isinstance(column, MultirowColumn)]
+    if len(multirowColumns) == 0 or row == rowCount - 1 or columns[multirowColumns[0]].getCell(row + 1) != "":
+        return "\\\\ \\hline"
+    clines = ""
+    for i in range(len(columns)):
+        if i not in multirowColumns and (i == 0 or i - 1 in multirowColumns):
+            end = i
+            while end + 1 < len(columns) and end + 1 not in multirowColumns:
+                end += 1
+            clines += "\\cline{" + str(i + 1) + "-" + str(end + 1) + "}"
+    return ("\\\\ " + clines).rstrip()
+
+
+def referenceGroupStatistics(keys: list, data, ddof: int):
+    # Per-group Python loop with np.mean and np.std, the reference for the vectorized Table.groupBy statistics.
+    values = np.ma.getdata(getattr(getattr(data, "unmasked", data), "value", data))
+    mask = getattr(data, "mask", None)
+    valid = np.isfinite(values)
+    if mask is not None and mask is not np.ma.nomask:
+        valid &= ~np.asarray(mask)
+    keys = np.array(keys)
+    labels = sorted(set(keys.tolist()))
+    means = []
+    stds = []
+    for label in labels:
+        group = values[(keys == label) & valid]
+        means.append(np.mean(group) if len(group) > 0 else np.nan)
+        stds.append(np.std(group, ddof=ddof) if len(group) > ddof else np.nan)
+    return labels, np.array(means), np.array(stds)
+
+
+def buildParallelTable(arrays):
+    return (Table("Parallel")
+            .serialColumn("No.", len(arrays["data"]))
+            .dataColumn("Data", arrays["data"], RelativeError(0.05))
+            .dataColumn("Mass", arrays["mass"], formatter=ExponentialFormatter())
+            .dataColumn("Masked", arrays["masked"], formatter=FloatFormatter(2, 2)))
+
+
+class TestParity(TestCase):
+
+    throughputs = []
+
+    @classmethod
+    def tearDownClass(cls):
+        if REPORT:
+            for name, rows, reference, accelerated in cls.throughputs:
+                print("{}: {} rows, reference {:.0f} rows/s, accelerated {:.0f} rows/s ({:.1f}x)"
+                      .format(name, rows, rows / reference, rows / accelerated, reference / accelerated), file=sys.stderr)
+
+    def assertParity(self, name: str, rows: int, reference, accelerated):
+        start = time.perf_counter()
+        expected = reference()
+        middle = time.perf_counter()
+        actual = accelerated()
+        end = time.perf_counter()
+        self.throughputs.append((name, rows, middle - start, end - middle))
+        self.assertEqual(len(actual), len(expected))
+        for i, (actualItem, expectedItem) in enumerate(zip(actual, expected)):
+            self.assertEqual(actualItem, expectedItem, "{} differs at index {}".format(name, i))
+
+    def test_formatArray(self):
+        rng = np.random.default_rng(SEED)
+        for i in range(8):
+            formatter = randomFormatter(rng) or FloatFormatter()
+            values = randomValues(rng, ROWS)
+            values[rng.random(ROWS) < 0.01] = np.nan
+            errors = np.abs(values) * rng.uniform(0, 0.2, ROWS)
+            self.assertParity(type(formatter).__name__ + ".formatArray", ROWS,
+                              lambda: [formatter.format(value) for value in values],
+                              lambda: formatter.formatArray(values))
+            self.assertParity(type(formatter).__name__ + ".formatArray with errors", ROWS,
+                              lambda: [formatter.format(value, error) for value, error in zip(values, errors)],
+                              lambda: formatter.formatArray(values, errors))
+
+    def test_dataColumnCells(self):
+        rng = np.random.default_rng(SEED + 1)
+        for i in range(8):
+            data = randomData(rng, ROWS, True)
+            column = DataColumn("Data", data, randomError(rng, data), randomFormatter(rng), placeholder="--")
+            self.assertParity("DataColumn.getCells", ROWS,
+                              lambda: [column.getCell(row) for row in range(ROWS)], column.getCells)
+
+    def test_textColumnCells(self):
+        rng = np.random.default_rng(SEED + 2)
+        texts = rng.choice(LABELS, ROWS).tolist()
+        self.assertParity("escaped TextColumn.getCells", ROWS,
+                          lambda: [escapeLateX(text) for text in texts], lambda: TextColumn("Label", texts, True).getCells())
+        self.assertParity("CategoricalColumn.getCells", ROWS,
+                          lambda: [escapeLateX(text) for text in texts],
+                          lambda: CategoricalColumn.fromTexts("Label", texts, True).getCells())
+
+    def test_tableLines(self):
+        rng = np.random.default_rng(SEED + 3)
+        for i in range(4):
+            table = randomTable(rng, ROWS)
+            tabLength = int(rng.integers(1, 9))
+            separator = str(rng.choice(['.', ',']))
+            self.assertParity("Table.lines", ROWS,
+                              lambda: referenceLines(table, tabLength, separator),
+                              lambda: table.lines(tabLength, separator))
+
+    def test_groupBy(self):
+        rng = np.random.default_rng(SEED + 6)
+        for ddof in (0, 1):
+            keys = rng.choice(LABELS, ROWS).tolist()
+            data = randomData(rng, ROWS, True)
+            labels, means, stds = referenceGroupStatistics(keys, data, ddof)
+            groups = Groups(keys)
+            self.assertEqual(groups.getLabels(), labels)
+            # np.add.reduceat sums in a different order than np.sum, so the statistics agree to rounding only.
+            unit = getattr(data, "unit", 1)
+            self.assertTrue(np.allclose(groups.mean(data) / unit, means, rtol=1e-12, atol=0, equal_nan=True))
+            self.assertTrue(np.allclose(groups.std(data, ddof) / unit, stds, rtol=1e-12, atol=0, equal_nan=True))
+            table = Table("Grouped").groupBy("Key", keys, {"Data": data}, randomFormatter(rng), ddof=ddof, placeholder="--")
+            self.assertParity("Table.groupBy", ROWS, lambda: referenceLines(table), table.lines)
+
+    def test_multirowLines(self):
+        rng = np.random.default_rng(SEED + 7)
+        keys = np.sort(rng.choice(LABELS, ROWS)).tolist()
+        data = randomData(rng, ROWS, True)
+        table = (Table("Multirow")
+                 .serialColumn("No.", ROWS)
+                 .groupBy("Key", keys, {"Data": data}, randomFormatter(rng), multirow=True, placeholder="n.a.")
+                 .dataColumn("Data", data, randomError(rng, data), randomFormatter(rng)))
+        for separator in ['.', ',']:
+            self.assertParity("multirow Table.lines", ROWS,
+                              lambda: referenceLines(table, 4, separator), lambda: table.lines(4, separator))
+
+    def test_renderPlan(self):
+        table = randomTable(np.random.default_rng(SEED + 4), ROWS)
+        plan = table.compile()
+        for separator in ['.', ',']:
+            self.assertParity("compiled RenderPlan.lines", ROWS,
+                              lambda: referenceLines(table, 4, separator), lambda: plan.lines(4, separator))
+
+    def test_parallelRenderer(self):
+        rng = np.random.default_rng(SEED + 5)
+        arrays = {"data": randomValues(rng, ROWS),
+                  "mass": randomValues(rng, ROWS) * units.kg,
+                  "masked": np.ma.array(randomValues(rng, ROWS), mask=rng.random(ROWS) < 0.05)}
+        chunks = [slice(start, min(start + ROWS // 4 + 1, ROWS)) for start in range(0, ROWS, ROWS // 4 + 1)]
+        with ParallelRenderer(arrays, processes=2) as renderer:
+            self.assertParity("ParallelRenderer.render", ROWS,
+                              lambda: [referenceLines(buildParallelTable({key: array[rows]
+                                                                          for key, array in arrays.items()}))
+                                       for rows in chunks],
+                              lambda: renderer.render([(buildParallelTable, rows) for rows in chunks]))
+
+
+if __name__ == '__main__':
+    main()
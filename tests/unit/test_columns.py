@@ -1,11 +1,13 @@
 from unittest import TestCase, main
 from unittest.mock import MagicMock
+from types import SimpleNamespace
 import numpy as np
 from astropy import units
-from src.latab import SerialNumberColumn, TextColumn, DataColumn, FloatFormatter, ExponentialFormatter
+from astropy.utils.masked import Masked
+from src.latab import SerialNumberColumn, TextColumn, CategoricalColumn, DataColumn, FloatFormatter, ExponentialFormatter
 from src.latab.formatters import Formatter
-from src.latab.columns import Column
-from src.latab.errors import Error, FixError
+from src.latab.columns import Column, MultirowColumn
+from src.latab.errors import Error, FixError, AbsoluteError, RelativeError
 
 HEADER = "header"
 HEADER_WITH_UNIT = "header [$\mathrm{AU}$]"
@@ -13,6 +15,8 @@ TEXTS = ["A", "B", "C", "D", "E", "F", "G", "H", "I", "J"]
 LINES = 10
 WRONG_DATA_TYPE_MESSAGE = "^Data must be of type numpy.ndarray or astropy.units.Quantity$"
 WRONG_ERROR_TYPE_MESSAGE = "^Error must be of type latab.Error$"
+WRONG_CODES_TYPE_MESSAGE = "^Codes must be of type numpy.ndarray with integer elements$"
+WRONG_CODES_MESSAGE = "^Codes must be valid indices of the categories or -1$"
 WRONG_FORMATTER_MESSAGE = "^The argument 'formatter' must be a subclass of latab.Formatter$"
 DATA = np.random.rand(LINES) * 100
 ERRORS = DATA * 0.05
@@ -44,6 +48,9 @@ class TestSerialNumberColumn(TestCase):
         with self.assertRaises(IndexError):
             self.underTest.getCell(LINES)
 
+    def test_shouldEscapeHeader(self):
+        self.assertEqual(SerialNumberColumn("No_", LINES, escape=True).getHeader(), "No\\_")
+
 
 class TestTextColumn(TestCase):
 
@@ -60,11 +67,107 @@ class TestTextColumn(TestCase):
         self.assertEqual(self.underTest.getCell(0), "A")
         self.assertEqual(self.underTest.getCell(6), "G")
 
+    def test_shouldReturnCorrectCells(self):
+        self.assertEqual(self.underTest.getCells(), TEXTS)
+
+    def test_shouldNotEscapeByDefault(self):
+        underTest = TextColumn("a_b", ["R&D", "50%"])
+        self.assertEqual(underTest.getHeader(), "a_b")
+        self.assertEqual(underTest.getCells(), ["R&D", "50%"])
+
+    def test_shouldEscapeHeaderAndTexts(self):
+        underTest = TextColumn("a_b", ["R&D", "50%", "R&D"], escape=True)
+        self.assertEqual(underTest.getHeader(), "a\\_b")
+        self.assertEqual(underTest.getCell(0), "R\\&D")
+        self.assertEqual(underTest.getCells(), ["R\\&D", "50\\%", "R\\&D"])
+
     def test_shouldRaiseExceptionForIndexOutOfBounds(self):
         with self.assertRaises(IndexError):
             self.underTest.getCell(LINES)
 
 
+class TestCategoricalColumn(TestCase):
+
+    def setUp(self):
+        self.underTest = CategoricalColumn(HEADER, np.array([1, 0, 1, -1]), ["R&D", "type_b"])
+
+    def test_shouldReturnCorrectHeader(self):
+        self.assertEqual(self.underTest.getHeader(), HEADER)
+
+    def test_shouldReturnCorrectLength(self):
+        self.assertEqual(len(self.underTest), 4)
+
+    def test_shouldReturnCorrectCell(self):
+        self.assertEqual(self.underTest.getCell(0), "type_b")
+        self.assertEqual(self.underTest.getCell(1), "R&D")
+        self.assertEqual(self.underTest.getCell(3), " ")
+
+    def test_shouldReturnCorrectCells(self):
+        self.assertEqual(self.underTest.getCells(), ["type_b", "R&D", "type_b", " "])
+
+    def test_shouldRaiseExceptionForIndexOutOfBounds(self):
+        with self.assertRaises(IndexError):
+            self.underTest.getCell(4)
+
+    def test_shouldEscapeHeaderAndCategories(self):
+        underTest = CategoricalColumn("a_b", np.array([1, 0, -1]), ["R&D", "type_b"], escape=True, placeholder="--")
+        self.assertEqual(underTest.getHeader(), "a\\_b")
+        self.assertEqual(underTest.getCells(), ["type\\_b", "R\\&D", "--"])
+
+    def test_shouldRaiseExceptionForWrongCodesType(self):
+        with self.assertRaisesRegex(Exception, WRONG_CODES_TYPE_MESSAGE):
+            CategoricalColumn(HEADER, [0, 1], ["a", "b"])
+        with self.assertRaisesRegex(Exception, WRONG_CODES_TYPE_MESSAGE):
+            CategoricalColumn(HEADER, np.array([0.0, 1.0]), ["a", "b"])
+
+    def test_shouldRaiseExceptionForInvalidCodes(self):
+        with self.assertRaisesRegex(Exception, WRONG_CODES_MESSAGE):
+            CategoricalColumn(HEADER, np.array([0, 2]), ["a", "b"])
+        with self.assertRaisesRegex(Exception, WRONG_CODES_MESSAGE):
+            CategoricalColumn(HEADER, np.array([0, -2]), ["a", "b"])
+
+    def test_shouldCreateFromTexts(self):
+        underTest = CategoricalColumn.fromTexts(HEADER, TEXTS * 3)
+        self.assertEqual(len(underTest), 3 * LINES)
+        self.assertEqual(len(underTest._CategoricalColumn__categories), LINES + 1)
+        self.assertEqual(underTest.getCells(), TEXTS * 3)
+
+    def test_shouldCreateFromCategorical(self):
+        categorical = SimpleNamespace(codes=np.array([0, 1, -1, 0], dtype=np.int8), categories=["x", "y"])
+        underTest = CategoricalColumn.fromCategorical(HEADER, categorical, placeholder="-")
+        self.assertEqual(underTest.getCells(), ["x", "y", "-", "x"])
+
+
+class TestMultirowColumn(TestCase):
+
+    def setUp(self):
+        self.underTest = MultirowColumn(TextColumn(HEADER, ["A", "B", "C"]), np.array([2, 1, 3]))
+
+    def test_shouldReturnCorrectHeader(self):
+        self.assertEqual(self.underTest.getHeader(), HEADER)
+
+    def test_shouldReturnCorrectLength(self):
+        self.assertEqual(len(self.underTest), 6)
+
+    def test_shouldReturnCorrectCell(self):
+        self.assertEqual(self.underTest.getCell(0), "\\multirow{2}{*}{A}")
+        self.assertEqual(self.underTest.getCell(1), "")
+        self.assertEqual(self.underTest.getCell(2), "\\multirow{1}{*}{B}")
+        self.assertEqual(self.underTest.getCell(3), "\\multirow{3}{*}{C}")
+        self.assertEqual(self.underTest.getCell(5), "")
+
+    def test_shouldReturnCorrectCells(self):
+        self.assertEqual(self.underTest.getCells(), [self.underTest.getCell(i) for i in range(6)])
+
+    def test_shouldRaiseExceptionForIndexOutOfBounds(self):
+        with self.assertRaises(IndexError):
+            self.underTest.getCell(6)
+
+    def test_shouldRaiseExceptionForWrongGroupCount(self):
+        with self.assertRaisesRegex(Exception, "^Column must have one cell for every group$"):
+            MultirowColumn(TextColumn(HEADER, ["A", "B"]), np.array([2, 1, 3]))
+
+
 class TestDataColumn(TestCase):
 
     def test_shouldReturnCorrectHeaderForQuantity(self):
@@ -165,6 +268,69 @@ class TestDataColumn(TestCase):
         underTest = DataColumn(HEADER, DATA * 100)
         self.assertIsInstance(underTest._DataColumn__formatter, FloatFormatter)
 
+    def test_shouldIgnoreNonFiniteValuesWhenChoosingFormatter(self):
+        underTest = DataColumn(HEADER, np.array([1.0, np.inf, np.nan, 2.0]))
+        self.assertIsInstance(underTest._DataColumn__formatter, FloatFormatter)
+
+    def test_shouldReturnPlaceholderForNonFiniteValues(self):
+        underTest = DataColumn(HEADER, np.array([1.0, np.inf, np.nan, -np.inf]), placeholder="--")
+        self.assertEqual(underTest.getCell(0), "1.000 ")
+        self.assertEqual(underTest.getCell(1), "--")
+        self.assertEqual(underTest.getCell(2), "--")
+        self.assertEqual(underTest.getCell(3), "--")
+
+    def test_shouldReturnPlaceholderForMaskedArray(self):
+        data = np.ma.array([1.0, 2.0, 3.0], mask=[False, True, False])
+        underTest = DataColumn(HEADER, data, FixError(0.5))
+        self.assertEqual(underTest.getCell(0), "$1.000 \\pm 0.5000$ ")
+        self.assertEqual(underTest.getCell(1), " ")
+
+    def test_shouldReturnPlaceholderForMaskedQuantity(self):
+        data = Masked(np.array([1.0, 2.0, 3.0]) * units.AU, mask=[True, False, False])
+        underTest = DataColumn(HEADER, data, placeholder="-")
+        self.assertEqual(underTest.getHeader(), HEADER_WITH_UNIT)
+        self.assertEqual(underTest.getCell(0), "-")
+        self.assertEqual(underTest.getCell(1), "2.000 ")
+
+    def test_shouldReturnPlaceholderForNonFiniteErrors(self):
+        underTest = DataColumn(HEADER, np.array([1.0, 2.0]), AbsoluteError(np.array([np.nan, 0.5])), placeholder="-")
+        self.assertEqual(underTest.getCell(0), "-")
+        self.assertEqual(underTest.getCell(1), "$2.000 \\pm 0.5000$ ")
+
+    def test_shouldReturnPlaceholderForMaskedQuantityErrors(self):
+        errors = Masked(np.array([0.5, 0.25, 0.125]) * units.kg, mask=[False, True, False])
+        underTest = DataColumn(HEADER, np.array([1.0, 2.0, 3.0]) * units.kg, AbsoluteError(errors), placeholder="-")
+        self.assertEqual(underTest.getCells(), ["$1.000 \\pm 0.5000$ ", "-", "$3.000 \\pm 0.1250$ "])
+        self.assertEqual(underTest.getCell(1), "-")
+
+    def test_shouldReturnPlaceholderForMaskedArrayErrors(self):
+        errors = np.ma.array([0.5, 0.25], mask=[True, False])
+        underTest = DataColumn(HEADER, np.array([1.0, 2.0]), AbsoluteError(errors), placeholder="-")
+        self.assertEqual(underTest.getCells(), ["-", "$2.000 \\pm 0.2500$ "])
+
+    def test_shouldGetCellsReturnSameCellsAsGetCell(self):
+        data = np.ma.array(DATA * 1000, mask=DATA > 80)
+        for underTest in (DataColumn(HEADER, data, placeholder="-"),
+                          DataColumn(HEADER, data, RelativeError(0.05)),
+                          DataColumn(HEADER, DATA, FixError(0.5), FloatFormatter(2, 2))):
+            self.assertEqual(underTest.getCells(), [underTest.getCell(i) for i in range(LINES)])
+
+    def test_shouldGetCellsUseOverriddenFormat(self):
+        class MarkedFormatter(FloatFormatter):
+            def format(self, value, error=None):
+                return "X"
+
+        underTest = DataColumn(HEADER, DATA, formatter=MarkedFormatter())
+        self.assertEqual(underTest.getCells(), ["X"] * LINES)
+        self.assertEqual(underTest.getCells(), [underTest.getCell(i) for i in range(LINES)])
+
+    def test_shouldNotFormatMaskedCells(self):
+        formatter = self.__mockFormatter()
+        underTest = DataColumn(HEADER, np.ma.array(DATA, mask=DATA > 50), formatter=formatter)
+        for i in range(LINES):
+            underTest.getCell(i)
+        self.assertEqual(formatter.format.call_count, np.count_nonzero(DATA <= 50))
+
 
 if __name__ == '__main__':
     main()
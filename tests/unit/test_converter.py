@@ -1,5 +1,5 @@
 from unittest import TestCase, main
-from src.latab.converter import convertUnitToLateX
+from src.latab.converter import convertUnitToLateX, escapeLateX, escapeLateXAll
 from astropy import units
 
 
@@ -26,5 +26,19 @@ class TestColumn(TestCase):
                          "$\mathrm{W^{9}\cdot cd^{4}\cdot m^{2}\cdot kg/(C\cdot s^{3})}$")
 
 
+class TestEscape(TestCase):
+
+    def test_escapeSpecialCharacters(self):
+        self.assertEqual(escapeLateX("A&B 5% a_b #1 $x$ {y}"), "A\\&B 5\\% a\\_b \\#1 \\$x\\$ \\{y\\}")
+        self.assertEqual(escapeLateX("a\\b~c^d"), "a\\textbackslash{}b\\textasciitilde{}c\\textasciicircum{}d")
+
+    def test_escapeWithoutSpecialCharacters(self):
+        self.assertEqual(escapeLateX("Kepler137b"), "Kepler137b")
+
+    def test_escapeAll(self):
+        self.assertEqual(escapeLateXAll(["a_b", "c", "a_b", "R&D"]), ["a\\_b", "c", "a\\_b", "R\\&D"])
+        self.assertEqual(escapeLateXAll([]), [])
+
+
 if __name__ == '__main__':
     main()
@@ -1,14 +1,72 @@
 from unittest import TestCase, main
+import numpy as np
 from src.latab import FloatFormatter, ExponentialFormatter, IntFormatter
 from src.latab.formatters import Formatter
 
 
+RNG = np.random.default_rng(20241019)
+VALUES = np.concatenate([(RNG.random(1000) - 0.5) * 10.0**RNG.integers(-30, 30, 1000),
+                         [0.0, -0.0, 1.0, 10.0, 1000.0, 1e-300, 9.9995, 0.99995, np.nan, np.inf, -np.inf]])
+ERRORS = np.abs(VALUES) * RNG.random(len(VALUES))
+
+
 class TestFormatter(TestCase):
 
     def test_FormatterIsAbstract(self):
         with self.assertRaises(TypeError):
             Formatter()
 
+    def test_formatArrayFallsBackToFormat(self):
+        class UpperFormatter(Formatter):
+            def format(self, value, error=None):
+                return str(value) if error is None else str(value) + "+" + str(error)
+
+        underTest = UpperFormatter(0, 0)
+        self.assertEqual(underTest.formatArray([1, 2]), ["1", "2"])
+        self.assertEqual(underTest.formatArray([1, 2], [3, 4]), ["1+3", "2+4"])
+
+
+class TestFormatArrayParity(TestCase):
+
+    def assertParity(self, underTest, values, errors=None):
+        if errors is None:
+            expected = [underTest.format(value) for value in values]
+        else:
+            expected = [underTest.format(value, error) for value, error in zip(values, errors)]
+        self.assertEqual(underTest.formatArray(values, errors), expected)
+
+    def test_floatFormatter(self):
+        for underTest in (FloatFormatter(), FloatFormatter(1, 6), IntFormatter(), IntFormatter(2)):
+            self.assertParity(underTest, VALUES)
+            self.assertParity(underTest, VALUES, ERRORS)
+
+    def test_exponentialFormatter(self):
+        for underTest in (ExponentialFormatter(), ExponentialFormatter(1, 6), ExponentialFormatter(0, 0)):
+            self.assertParity(underTest, VALUES)
+            self.assertParity(underTest, VALUES, ERRORS)
+
+    def test_integerValues(self):
+        values = RNG.integers(-100000, 100000, 100)
+        self.assertParity(IntFormatter(), values)
+        self.assertParity(ExponentialFormatter(), values, np.abs(values) * 0.1)
+
+    def test_overriddenFormatIsUsed(self):
+        class MarkedFloatFormatter(FloatFormatter):
+            def format(self, value, error=None):
+                return "X"
+
+        class MarkedExponentialFormatter(ExponentialFormatter):
+            def format(self, value, error=None):
+                return "X"
+
+        for underTest in (MarkedFloatFormatter(), MarkedExponentialFormatter()):
+            self.assertEqual(underTest.formatArray(np.array([1.0, 2.0])), ["X", "X"])
+            self.assertEqual(underTest.formatArray(np.array([1.0, 2.0]), np.array([0.1, 0.2])), ["X", "X"])
+
+    def test_objectValuesFallBackToFormat(self):
+        values = np.array([1.5, None, 2.5], dtype=object)
+        self.assertEqual(FloatFormatter().formatArray(values), ["1.500 ", " ", "2.500 "])
+
 
 class TestFloatFormatter(TestCase):
 
@@ -46,6 +104,11 @@ class TestFloatFormatter(TestCase):
         underTest = FloatFormatter()
         self.assertEqual(underTest.format(None), " ")
 
+    def test_nonFinite(self):
+        underTest = FloatFormatter()
+        self.assertEqual(underTest.format(float("nan")), " ")
+        self.assertEqual(underTest.format(float("inf"), 0.5), " ")
+
 
 class TestExponentialFormatter(TestCase):
 
@@ -94,6 +157,15 @@ class TestExponentialFormatter(TestCase):
         underTest = ExponentialFormatter()
         self.assertEqual(underTest.format(0), "0")
 
+    def test_sparse(self):
+        underTest = ExponentialFormatter()
+        self.assertEqual(underTest.format(None), " ")
+
+    def test_nonFinite(self):
+        underTest = ExponentialFormatter()
+        self.assertEqual(underTest.format(float("nan")), " ")
+        self.assertEqual(underTest.format(float("-inf"), 0.5), " ")
+
 
 class TestIntFormatter(TestCase):
     def test_format(self):
@@ -0,0 +1,107 @@
+from unittest import TestCase, main
+from types import SimpleNamespace
+import numpy as np
+from astropy import units
+from astropy.utils.masked import Masked
+from src.latab.grouping import Groups
+
+KEYS = ["b", "a", "b", "c", "a", "b"]
+DATA = np.array([1.0, 2.0, 3.0, 4.0, 6.0, 8.0])
+WRONG_ORDER_MESSAGE = "^Rows must be ordered by the group keys$"
+DIFFERENT_LENGTHS_MESSAGE = "^Data and group keys have different lengths$"
+WRONG_DATA_TYPE_MESSAGE = "^Data must be of type numpy.ndarray or astropy.units.Quantity$"
+
+
+class TestGroups(TestCase):
+
+    def test_shouldReturnSortedLabelsAndSizes(self):
+        underTest = Groups(KEYS)
+        self.assertEqual(len(underTest), 3)
+        self.assertEqual(underTest.getLabels(), ["a", "b", "c"])
+        self.assertTrue(np.array_equal(underTest.getSizes(), [2, 3, 1]))
+
+    def test_shouldComputeMeanAndStd(self):
+        underTest = Groups(KEYS)
+        self.assertTrue(np.allclose(underTest.mean(DATA), [4.0, 4.0, 4.0]))
+        self.assertTrue(np.allclose(underTest.std(DATA), [np.std([2.0, 6.0]), np.std([1.0, 3.0, 8.0]), 0.0]))
+
+    def test_shouldMatchPerGroupLoop(self):
+        keys = np.random.randint(0, 50, 10000)
+        data = np.random.rand(10000) * 100
+        underTest = Groups(keys)
+        labels = sorted(set(keys.tolist()))
+        self.assertEqual(underTest.getLabels(), [str(label) for label in labels])
+        self.assertTrue(np.allclose(underTest.mean(data), [np.mean(data[keys == label]) for label in labels]))
+        self.assertTrue(np.allclose(underTest.std(data), [np.std(data[keys == label]) for label in labels]))
+
+    def test_shouldSortNumericKeysNumerically(self):
+        underTest = Groups([1, 2, 10, 2])
+        self.assertEqual(underTest.getLabels(), ["1", "2", "10"])
+        self.assertTrue(np.allclose(underTest.mean(np.array([1.0, 2.0, 3.0, 4.0])), [1.0, 3.0, 3.0]))
+
+    def test_shouldKeepUnit(self):
+        underTest = Groups(KEYS)
+        self.assertEqual(underTest.mean(DATA * units.kg).unit, units.kg)
+        self.assertEqual(underTest.std(DATA * units.kg).unit, units.kg)
+
+    def test_shouldUseCategorical(self):
+        categorical = SimpleNamespace(codes=np.array([1, 0, 1]), categories=["x", "y"])
+        underTest = Groups(categorical)
+        self.assertEqual(underTest.getLabels(), ["x", "y"])
+        self.assertTrue(np.allclose(underTest.mean(np.array([1.0, 2.0, 3.0])), [2.0, 2.0]))
+
+    def test_shouldGroupMissingCategoricalCodesUnderPlaceholder(self):
+        categorical = SimpleNamespace(codes=np.array([0, -1, 1, -1]), categories=["x", "y"])
+        underTest = Groups(categorical, placeholder="-")
+        self.assertEqual(underTest.getLabels(), ["x", "y", "-"])
+        self.assertTrue(np.array_equal(underTest.getSizes(), [1, 1, 2]))
+        self.assertTrue(np.allclose(underTest.mean(np.array([1.0, 2.0, 3.0, 4.0])), [1.0, 3.0, 3.0]))
+
+    def test_shouldIgnoreMaskedAndNonFiniteValues(self):
+        underTest = Groups(["a", "a", "b", "b", "b"])
+        data = np.ma.array([1.0, 100.0, 3.0, 5.0, np.nan], mask=[False, True, False, False, False])
+        self.assertTrue(np.allclose(underTest.mean(data), [1.0, 4.0]))
+        self.assertTrue(np.allclose(underTest.std(data), [0.0, 1.0]))
+
+    def test_shouldIgnoreMaskedQuantityValues(self):
+        underTest = Groups(["a", "a", "b", "b"])
+        data = Masked(np.array([1.0, 100.0, 3.0, 5.0]) * units.kg, mask=[False, True, False, False])
+        self.assertTrue(np.allclose(underTest.mean(data).value, [1.0, 4.0]))
+
+    def test_shouldReturnNanForGroupWithoutValidValues(self):
+        underTest = Groups(["a", "b"])
+        self.assertTrue(np.isnan(underTest.mean(np.ma.array([1.0, 2.0], mask=[False, True]))[1]))
+
+    def test_shouldUseDdof(self):
+        underTest = Groups(["a", "a", "b", "b", "b"])
+        self.assertTrue(np.allclose(underTest.std(DATA[:5], ddof=1),
+                                    [np.std([1.0, 2.0], ddof=1), np.std([3.0, 4.0, 6.0], ddof=1)]))
+
+    def test_shouldHandleEmptyKeys(self):
+        underTest = Groups([])
+        self.assertEqual(len(underTest), 0)
+        self.assertEqual(underTest.getLabels(), [])
+        self.assertEqual(len(underTest.mean(np.array([]))), 0)
+        self.assertEqual(len(underTest.std(np.array([]))), 0)
+
+    def test_shouldKeepRowOrderForContiguousGroups(self):
+        underTest = Groups(["b", "b", "a", "c", "c"], contiguous=True)
+        self.assertEqual(underTest.getLabels(), ["b", "a", "c"])
+        self.assertTrue(np.array_equal(underTest.getSizes(), [2, 1, 2]))
+        self.assertTrue(np.allclose(underTest.mean(np.array([1.0, 3.0, 5.0, 7.0, 9.0])), [2.0, 5.0, 8.0]))
+
+    def test_shouldRaiseExceptionForNonContiguousGroups(self):
+        with self.assertRaisesRegex(Exception, WRONG_ORDER_MESSAGE):
+            Groups(KEYS, contiguous=True)
+
+    def test_shouldRaiseExceptionForDifferentLengths(self):
+        with self.assertRaisesRegex(Exception, DIFFERENT_LENGTHS_MESSAGE):
+            Groups(KEYS).mean(DATA[1:])
+
+    def test_shouldRaiseExceptionForWrongDataType(self):
+        with self.assertRaisesRegex(Exception, WRONG_DATA_TYPE_MESSAGE):
+            Groups(KEYS).mean(list(DATA))
+
+
+if __name__ == '__main__':
+    main()
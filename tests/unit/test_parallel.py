@@ -0,0 +1,75 @@
+from unittest import TestCase, main
+import numpy as np
+from astropy import units
+from astropy.utils.masked import Masked
+from src.latab import ParallelRenderer, Table, RelativeError
+
+WRONG_ARRAY_TYPE_MESSAGE = "^Shared arrays must be of type numpy.ndarray or astropy.units.Quantity$"
+WRONG_OBJECT_ARRAY_MESSAGE = ("^Shared arrays must be of type numpy.ndarray or astropy.units.Quantity "
+                              "without Python objects$")
+DATA = np.random.rand(100) * 100
+MASS = np.random.rand(100) * 1e20 * units.kg
+MASKED = np.ma.array(DATA, mask=DATA > 50)
+MASKED_QUANTITY = Masked(DATA * units.AU, mask=DATA < 50)
+
+
+def buildTable(arrays):
+    return (Table("caption")
+            .serialColumn("No.", len(arrays["data"]))
+            .dataColumn("Data", arrays["data"], RelativeError(0.01))
+            .dataColumn("Mass", arrays["mass"])
+            .dataColumn("Masked", arrays["masked"])
+            .dataColumn("Masked quantity", arrays["maskedQuantity"]))
+
+
+def buildDataTable(arrays):
+    return Table().dataColumn("Data", arrays["data"])
+
+
+def arrays(rows: slice = slice(None)):
+    return {"data": DATA[rows], "mass": MASS[rows], "masked": MASKED[rows], "maskedQuantity": MASKED_QUANTITY[rows]}
+
+
+class TestParallelRenderer(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.underTest = ParallelRenderer(arrays(), processes=2)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.underTest.close()
+
+    def test_shouldRenderSameLinesAsTable(self):
+        self.assertEqual(self.underTest.lines(buildTable), buildTable(arrays()).lines())
+
+    def test_shouldPassArgumentsToLines(self):
+        self.assertEqual(self.underTest.lines(buildTable, tabLength=2, separator=','),
+                         buildTable(arrays()).lines(2, ','))
+
+    def test_shouldRenderRowRange(self):
+        self.assertEqual(self.underTest.lines(buildTable, slice(10, 20)), buildTable(arrays(slice(10, 20))).lines())
+
+    def test_shouldRenderTasksInOrder(self):
+        tasks = [buildDataTable, (buildTable, slice(0, 50)), (buildTable, slice(50, 100))]
+        expected = [buildDataTable(arrays()).lines(),
+                    buildTable(arrays(slice(0, 50))).lines(),
+                    buildTable(arrays(slice(50, 100))).lines()]
+        self.assertEqual(self.underTest.render(tasks), expected)
+
+    def test_shouldRaiseExceptionForWrongArrayType(self):
+        with self.assertRaisesRegex(Exception, WRONG_ARRAY_TYPE_MESSAGE):
+            ParallelRenderer({"data": [1, 2, 3]})
+
+    def test_shouldRaiseExceptionForObjectArray(self):
+        with self.assertRaisesRegex(Exception, WRONG_OBJECT_ARRAY_MESSAGE):
+            ParallelRenderer({"data": DATA, "texts": np.array(["a", None], dtype=object)})
+
+    def test_shouldReleaseSharedMemoryOnClose(self):
+        with ParallelRenderer({"data": DATA}, processes=1) as renderer:
+            self.assertEqual(renderer.lines(buildDataTable), buildDataTable({"data": DATA}).lines())
+        self.assertEqual(renderer._ParallelRenderer__blocks, [])
+
+
+if __name__ == '__main__':
+    main()
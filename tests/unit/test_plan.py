@@ -0,0 +1,88 @@
+from unittest import TestCase, main
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import FrozenInstanceError
+import numpy as np
+from astropy import units
+from src.latab import Table, RenderPlan, FixError, RelativeError, AbsoluteError, FloatFormatter
+
+ROWS = 1000
+DATA = np.random.rand(ROWS) * 100
+MASS = np.random.rand(ROWS) * 1e20 * units.kg
+TEXTS = ["Kepler{}.b".format(i) for i in range(ROWS)]
+
+
+def table():
+    return (Table("caption")
+            .serialColumn("No.", ROWS)
+            .textColumn("Planet", TEXTS)
+            .dataColumn("Data", DATA, FixError(0.5))
+            .dataColumn("Mass", MASS, RelativeError(0.05)))
+
+
+def exampleTable(localized: bool):
+    planets = ["Kepler137b", "Kepler137c", "Kepler137d", "Kepler137e", "Kepler137f", "Kepler137g"]
+    array1 = np.array([13.35000606, 0.76642346, 1.42476496, 9.27577478, 3.83978828, 1.88922311])
+    array2 = np.array([1.8131508, 5.3586463, 5.6288616, 7.4245393, 8.1266426, 4.5811065]) * units.g / units.cm**3
+    array3 = np.array([9.47738782e+20, 9.06469621e+20, 2.50771562e+20, 8.85737743e+20,
+                       7.04538193e+20, 8.90478371e+20]) * units.kg
+    errors = np.array([0.034574, 0.072827, 0.04782, 0.098236, 0.018896, 0.071311]) * units.g / units.cm**3
+    if localized:
+        return (Table("Aprócska kalapocska, benne csacska macska mocska.")
+                .serialColumn("Bolygó", 6)
+                .dataColumn("Félnagytengely [AU]", array1, FixError(0.0005))
+                .dataColumn("$\\varrho$", array2, AbsoluteError(errors), FloatFormatter(2, 2))
+                .dataColumn("Tömeg", array3, RelativeError(0.05)))
+    return (Table("Nobody expects the Spanish inquisition.")
+            .textColumn("Planet", planets)
+            .dataColumn("Semi-major Axis [AU]", array1, FixError(0.0005))
+            .dataColumn("$\\varrho$", array2, AbsoluteError(errors), FloatFormatter(2, 2))
+            .dataColumn("Mass", array3, RelativeError(0.05)))
+
+
+class TestRenderPlan(TestCase):
+
+    def setUp(self):
+        self.underTest = table().compile()
+
+    def test_shouldCompileToRenderPlan(self):
+        self.assertIsInstance(self.underTest, RenderPlan)
+
+    def test_shouldBeImmutable(self):
+        with self.assertRaises(FrozenInstanceError):
+            self.underTest.caption = "other"
+        self.assertIsInstance(self.underTest.columns, tuple)
+        for cells in self.underTest.columns:
+            self.assertIsInstance(cells, tuple)
+
+    def test_shouldRenderExpectedLines(self):
+        for example, separator in (("example1", '.'), ("example2", ',')):
+            with open("tests/integration/" + example + ".txt") as file:
+                expectedLines = [line.rstrip() for line in file]
+            lines = exampleTable(separator != '.').compile().lines(separator=separator)
+            self.assertEqual([line.rstrip() for line in lines], expectedLines)
+
+    def test_shouldRenderGroupedLines(self):
+        plan = (Table().groupBy("Type", ["b", "b", "a"], {"Data": np.array([1.0, 3.0, 5.0])}, FloatFormatter(1, 1), True)
+                .dataColumn("Data", np.array([1.0, 3.0, 5.0]), formatter=FloatFormatter(1))).compile()
+        self.assertEqual(plan.lines(2, ',')[3:7],
+                         ["    Type & Data & Data \\\\ \\hline",
+                          "    \\multirow{2}{*}{b} & \\multirow{2}{*}{$2,0 \\pm 1,0$ } & 1,0  \\\\ \\cline{3-3}",
+                          "     &  & 3,0  \\\\ \\hline",
+                          "    \\multirow{1}{*}{a} & \\multirow{1}{*}{$5,0 \\pm 0,0$ } & 5,0  \\\\ \\hline"])
+
+    def test_shouldReplaceSeparatorOnlyInDataColumns(self):
+        line = self.underTest.lines(separator=',')[4]
+        self.assertTrue(line.startswith("        1. & Kepler0.b & $"))
+        self.assertNotIn(".", line[len("        1. & Kepler0.b & "):])
+
+    def test_shouldRenderConcurrently(self):
+        expected = [self.underTest.lines(), self.underTest.lines(2, ',')]
+        arguments = [(4, '.'), (2, ',')] * 50
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda args: self.underTest.lines(*args), arguments))
+        for i, result in enumerate(results):
+            self.assertEqual(result, expected[i % 2])
+
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,8 @@
 from unittest import TestCase, main
 from unittest.mock import MagicMock, patch
 import numpy as np
-from src.latab import Table
+from astropy import units
+from src.latab import Table, FloatFormatter
 
 HEADER = "header"
 DIFFERENT_LENGTHS_MESSAGE = "^Columns have different lengths$"
@@ -50,6 +51,91 @@ class TestTable(TestCase):
         self.assertTrue(calls[1].args[0].startswith("        \\centering"))
         self.assertTrue(calls[3].args[0].startswith("                header"))
 
+    def test_shouldNotEscapeByDefault(self):
+        lines = Table("50% of #1").textColumn("a_b", ["R&D"]).lines()
+        self.assertEqual(lines[3], "        a_b \\\\ \\hline")
+        self.assertEqual(lines[4], "        R&D \\\\ \\hline")
+        self.assertEqual(lines[6], "    \\caption{50% of #1}")
+
+    def test_shouldEscapeCaptionAndTextColumns(self):
+        lines = Table("50% of #1", escape=True).textColumn("a_b", ["R&D"]).dataColumn("$x$", DATA[0:1]).lines()
+        self.assertTrue(lines[3].startswith("        a\\_b & $x$ "))
+        self.assertTrue(lines[4].startswith("        R\\&D & "))
+        self.assertEqual(lines[6], "    \\caption{50\\% of \\#1}")
+
+    def test_shouldEscapeSerialColumnHeader(self):
+        lines = Table("x", escape=True).serialColumn("No_", 1).serialColumn("No_", 1, escape=False).lines()
+        self.assertEqual(lines[3], "        No\\_ & No_ \\\\ \\hline")
+        self.assertEqual(lines[4], "        1. & 1. \\\\ \\hline")
+
+    def test_shouldTextColumnOverrideTableEscape(self):
+        lines = Table(escape=True).textColumn("a_b", ["R&D"], escape=False).textColumn("a_b", ["R&D"]).lines()
+        self.assertEqual(lines[4], "        R&D & R\\&D \\\\ \\hline")
+
+    def test_shouldCategoricalColumnRenderLikeTextColumn(self):
+        texts = ["a_b", "c", "a_b", "R&D"]
+        expected = Table(escape=True).textColumn(HEADER, texts).lines()
+        self.assertEqual(Table(escape=True).categoricalColumn(HEADER, texts).lines(), expected)
+        self.assertEqual(Table(escape=True).categoricalColumn(HEADER, np.array([0, 1, 0, 2]), ["a_b", "c", "R&D"]).lines(),
+                         expected)
+
+    def test_shouldCategoricalColumnPassPlaceholder(self):
+        lines = Table().categoricalColumn(HEADER, np.array([0, -1]), ["a"], placeholder="--").lines()
+        self.assertEqual(lines[4], "        a \\\\ \\hline")
+        self.assertEqual(lines[5], "        -- \\\\ \\hline")
+
+    def test_shouldCategoricalColumnCheckRowCount(self):
+        with self.assertRaisesRegex(Exception, DIFFERENT_LENGTHS_MESSAGE):
+            Table().serialColumn(HEADER, 10).categoricalColumn(HEADER, ["", ""])
+
+    def test_shouldNotReplaceSeparatorInPlaceholders(self):
+        table = Table().dataColumn("x", np.array([1.0, np.nan]), formatter=FloatFormatter(1), placeholder="n.a.")
+        lines = table.lines(separator=",")
+        self.assertEqual(lines[4], "        1,0  \\\\ \\hline")
+        self.assertEqual(lines[5], "        n.a. \\\\ \\hline")
+
+    def test_shouldNotReplaceSeparatorInMultirowPlaceholders(self):
+        data = np.ma.array([1.0, 2.0, 3.0], mask=[True, True, False])
+        table = Table().groupBy("Type", ["a", "a", "b"], {"x": data}, FloatFormatter(1, 1), True, placeholder="n.a.")
+        lines = table.lines(separator=",")
+        self.assertEqual(lines[4], "        \\multirow{2}{*}{a} & \\multirow{2}{*}{n.a.} \\\\")
+        self.assertEqual(lines[6], "        \\multirow{1}{*}{b} & \\multirow{1}{*}{$3,0 \\pm 0,0$ } \\\\ \\hline")
+
+    def test_shouldGroupByKeys(self):
+        lines = Table().groupBy("Type", ["b", "a", "b"], {"Mass": np.array([1.0, 2.0, 3.0]) * units.kg},
+                                FloatFormatter(1, 1)).lines()
+        self.assertEqual(lines[2], "    \\begin{tabular}{|c|c|} \\hline")
+        self.assertEqual(lines[3], "        Type & Mass [$\\mathrm{kg}$] \\\\ \\hline")
+        self.assertEqual(lines[4], "        a & $2.0 \\pm 0.0$  \\\\ \\hline")
+        self.assertEqual(lines[5], "        b & $2.0 \\pm 1.0$  \\\\ \\hline")
+
+    def test_shouldGroupByEmptyKeys(self):
+        lines = Table().groupBy("Type", [], {"Data": np.array([])}).lines()
+        self.assertEqual(lines[4], "    \\end{tabular}")
+
+    def test_shouldGroupByIgnoreMaskedValues(self):
+        data = np.ma.array([1.0, 100.0, 3.0, 5.0], mask=[False, True, False, False])
+        lines = Table().groupBy("Type", ["a", "a", "b", "b"], {"Data": data}, FloatFormatter(1, 1), ddof=1,
+                                placeholder="--").lines()
+        self.assertEqual(lines[4], "        a & -- \\\\ \\hline")
+        self.assertEqual(lines[5], "        b & $4.0 \\pm 1.4$  \\\\ \\hline")
+
+    def test_shouldGroupByCheckRowCount(self):
+        with self.assertRaisesRegex(Exception, DIFFERENT_LENGTHS_MESSAGE):
+            Table().serialColumn(HEADER, 3).groupBy("Type", ["b", "a", "b"], {"Data": DATA[0:3]})
+
+    def test_shouldGroupByWithMultirow(self):
+        lines = (Table().groupBy("Type", ["b", "b", "a"], {"Data": np.array([1.0, 3.0, 5.0])}, FloatFormatter(1, 1), True)
+                 .dataColumn("Data", np.array([1.0, 3.0, 5.0]), formatter=FloatFormatter(1))).lines(separator=',')
+        self.assertEqual(lines[4],
+                         "        \\multirow{2}{*}{b} & \\multirow{2}{*}{$2,0 \\pm 1,0$ } & 1,0  \\\\ \\cline{3-3}")
+        self.assertEqual(lines[5], "         &  & 3,0  \\\\ \\hline")
+        self.assertEqual(lines[6], "        \\multirow{1}{*}{a} & \\multirow{1}{*}{$5,0 \\pm 0,0$ } & 5,0  \\\\ \\hline")
+
+    def test_shouldRaiseExceptionForDifferentMultirowGroups(self):
+        with self.assertRaisesRegex(Exception, "^Tables can only be grouped by one key$"):
+            Table().groupBy("A", ["a", "a", "b"], {}, multirow=True).groupBy("B", ["a", "b", "b"], {}, multirow=True)
+
 
 if __name__ == '__main__':
     main()